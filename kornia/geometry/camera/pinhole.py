@@ -2,13 +2,45 @@ from typing import Iterable, List, Union
 
 import torch
 
-from kornia.core import Device, Tensor, eye, stack, zeros
+from kornia.core import Device, Dtype, Tensor, stack, where, zeros
 from kornia.core.check import KORNIA_CHECK_SAME_DEVICE
 from kornia.geometry.conversions import convert_points_from_homogeneous, convert_points_to_homogeneous
 from kornia.geometry.linalg import inverse_transformation, transform_points
 from kornia.utils.helpers import _torch_inverse_cast
 
 
+# entries of the intrinsics matrix holding the focal lengths and the principal point
+_INTRINSICS_SCALE_MASK = [[True, False, True, False], [False, True, True, False], [False] * 4, [False] * 4]
+
+
+def _intrinsics_scale_factor(intrinsics: Tensor, scale_factor: Union[float, Tensor]) -> Tensor:
+    r"""Return the factor that scales the focal lengths and principal point of a batch of intrinsics.
+
+    The factor is :math:`s` at the :math:`(f_x, f_y, c_x, c_y)` entries and one elsewhere, so that the
+    intrinsics can be scaled with a single multiply leaving the remaining entries untouched. It has the
+    dtype of the intrinsics so that the product never promotes the camera buffers.
+    """
+    mask: Tensor = torch.tensor(_INTRINSICS_SCALE_MASK, device=intrinsics.device)
+    if isinstance(scale_factor, Tensor):
+        scale_factor = scale_factor[..., None, None].to(intrinsics.dtype)
+    return where(mask, scale_factor, 1.0).to(intrinsics.dtype)
+
+
+def _scale_intrinsics_(intrinsics: Tensor, scale_factor: Union[float, Tensor]) -> Tensor:
+    r"""Scale in-place the focal lengths and principal point of a batch of intrinsics matrices."""
+    intrinsics *= _intrinsics_scale_factor(intrinsics, scale_factor)
+    return intrinsics
+
+
+def _scale_intrinsics(intrinsics: Tensor, scale_factor: Union[float, Tensor]) -> Tensor:
+    r"""Return a copy of a batch of intrinsics matrices with scaled focal lengths and principal point.
+
+    Out-of-place version of :func:`_scale_intrinsics_` which writes the output only once, instead of
+    cloning the input and updating it afterwards.
+    """
+    return intrinsics * _intrinsics_scale_factor(intrinsics, scale_factor)
+
+
 class PinholeCamera:
     r"""Class that represents a Pinhole Camera model.
 
@@ -41,13 +73,15 @@ class PinholeCamera:
 
     @staticmethod
     def _check_valid(data_iter: Iterable[Tensor]) -> bool:
-        if not all(data.shape[0] for data in data_iter):
+        first, *others = data_iter
+        batch_size: int = first.shape[0]
+        if not all(data.shape[0] == batch_size for data in others):
             raise ValueError("Arguments shapes must match")
         return True
 
     @staticmethod
     def _check_valid_params(data: Tensor, data_name: str) -> bool:
-        if len(data.shape) not in (3, 4) and data.shape[-2:] != (4, 4):  # Shouldn't this be an OR logic than AND?
+        if len(data.shape) not in (3, 4) or data.shape[-2:] != (4, 4):
             raise ValueError(
                 f"Argument {data_name} shape must be in the following shape Bx4x4 or BxNx4x4. Got {data.shape}"
             )
@@ -73,6 +107,29 @@ class PinholeCamera:
         """
         return self._intrinsics.device
 
+    def to(self, device: Device = None, dtype: Dtype = None) -> "PinholeCamera":
+        r"""Move the camera buffers to the given device and dtype in-place.
+
+        Casting to a reduced precision dtype such as :obj:`torch.float16` or :obj:`torch.bfloat16` halves
+        the memory traffic of large batched pipelines; the camera operations keep the dtype of the buffers.
+        Only the 4x4 intrinsics and extrinsics matrices are cast, the image height and width keep their dtype.
+
+        Args:
+            device: the device to move the buffers to.
+            dtype: the floating point data type to cast the 4x4 matrices to.
+
+        Returns:
+            the camera model with the moved buffers.
+        """
+        if dtype is not None and not dtype.is_floating_point:
+            raise ValueError(f"PinholeCamera buffers must be in floating point. Got {dtype}")
+        # NOTE: the image sizes are only moved, reduced precision types cannot hold many common sizes exactly.
+        self.height = self.height.to(device=device)
+        self.width = self.width.to(device=device)
+        self._intrinsics = self._intrinsics.to(device=device, dtype=dtype)
+        self._extrinsics = self._extrinsics.to(device=device, dtype=dtype)
+        return self
+
     @property
     def intrinsics(self) -> Tensor:
         r"""The full 4x4 intrinsics matrix.
@@ -80,8 +137,6 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B, 4, 4)`.
         """
-        if not self._check_valid_params(self._intrinsics, "intrinsics"):
-            raise AssertionError
         return self._intrinsics
 
     @property
@@ -91,8 +146,6 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B, 4, 4)`.
         """
-        if not self._check_valid_params(self._extrinsics, "extrinsics"):
-            raise AssertionError
         return self._extrinsics
 
     @property
@@ -102,7 +155,7 @@ class PinholeCamera:
         Returns:
             scalar with the batch size.
         """
-        return self.intrinsics.shape[0]
+        return self._intrinsics.shape[0]
 
     @property
     def fx(self) -> Tensor:
@@ -111,7 +164,7 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B)`.
         """
-        return self.intrinsics[..., 0, 0]
+        return self._intrinsics[..., 0, 0]
 
     @property
     def fy(self) -> Tensor:
@@ -120,7 +173,7 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B)`.
         """
-        return self.intrinsics[..., 1, 1]
+        return self._intrinsics[..., 1, 1]
 
     @property
     def cx(self) -> Tensor:
@@ -129,7 +182,7 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B)`.
         """
-        return self.intrinsics[..., 0, 2]
+        return self._intrinsics[..., 0, 2]
 
     @property
     def cy(self) -> Tensor:
@@ -138,7 +191,7 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B)`.
         """
-        return self.intrinsics[..., 1, 2]
+        return self._intrinsics[..., 1, 2]
 
     @property
     def tx(self) -> Tensor:
@@ -147,12 +200,12 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B)`.
         """
-        return self.extrinsics[..., 0, -1]
+        return self._extrinsics[..., 0, -1]
 
     @tx.setter
     def tx(self, value: Union[Tensor, float]) -> "PinholeCamera":
         r"""Set the x-coordinate of the translation vector with the given value."""
-        self.extrinsics[..., 0, -1] = value
+        self._extrinsics[..., 0, -1] = value
         return self
 
     @property
@@ -162,12 +215,12 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B)`.
         """
-        return self.extrinsics[..., 1, -1]
+        return self._extrinsics[..., 1, -1]
 
     @ty.setter
     def ty(self, value: Union[Tensor, float]) -> "PinholeCamera":
         r"""Set the y-coordinate of the translation vector with the given value."""
-        self.extrinsics[..., 1, -1] = value
+        self._extrinsics[..., 1, -1] = value
         return self
 
     @property
@@ -177,12 +230,12 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B)`.
         """
-        return self.extrinsics[..., 2, -1]
+        return self._extrinsics[..., 2, -1]
 
     @tz.setter
     def tz(self, value: Union[Tensor, float]) -> "PinholeCamera":
         r"""Set the y-coordinate of the translation vector with the given value."""
-        self.extrinsics[..., 2, -1] = value
+        self._extrinsics[..., 2, -1] = value
         return self
 
     @property
@@ -192,7 +245,7 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B, 3, 4)`.
         """
-        return self.extrinsics[..., :3, :4]
+        return self._extrinsics[..., :3, :4]
 
     @property
     def camera_matrix(self) -> Tensor:
@@ -201,7 +254,7 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B, 3, 3)`.
         """
-        return self.intrinsics[..., :3, :3]
+        return self._intrinsics[..., :3, :3]
 
     @property
     def rotation_matrix(self) -> Tensor:
@@ -210,7 +263,7 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B, 3, 3)`.
         """
-        return self.extrinsics[..., :3, :3]
+        return self._extrinsics[..., :3, :3]
 
     @property
     def translation_vector(self) -> Tensor:
@@ -219,7 +272,7 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B, 3, 1)`.
         """
-        return self.extrinsics[..., :3, -1:]
+        return self._extrinsics[..., :3, -1:]
 
     def clone(self) -> "PinholeCamera":
         r"""Return a deep copy of the current object instance."""
@@ -235,7 +288,9 @@ class PinholeCamera:
         Returns:
             tensor of shape :math:`(B, 4, 4)`.
         """
-        return self.intrinsics.inverse()
+        # NOTE: the intrinsics can be any full 4x4 calibration matrix, so the pinhole structure cannot be
+        # assumed without inspecting the values. Use :func:`inverse_pinhole_matrix` for the closed form.
+        return _torch_inverse_cast(self.intrinsics)
 
     def scale(self, scale_factor: Tensor) -> "PinholeCamera":
         r"""Scale the pinhole model.
@@ -249,14 +304,10 @@ class PinholeCamera:
             the camera model with scaled parameters.
         """
         # scale the intrinsic parameters
-        intrinsics: Tensor = self.intrinsics.clone()
-        intrinsics[..., 0, 0] *= scale_factor
-        intrinsics[..., 1, 1] *= scale_factor
-        intrinsics[..., 0, 2] *= scale_factor
-        intrinsics[..., 1, 2] *= scale_factor
+        intrinsics: Tensor = _scale_intrinsics(self.intrinsics, scale_factor)
         # scale the image height/width
-        height: Tensor = scale_factor * self.height.clone()
-        width: Tensor = scale_factor * self.width.clone()
+        height: Tensor = scale_factor * self.height
+        width: Tensor = scale_factor * self.width
         return PinholeCamera(intrinsics, self.extrinsics, height, width)
 
     def scale_(self, scale_factor: Union[float, Tensor]) -> "PinholeCamera":
@@ -271,10 +322,7 @@ class PinholeCamera:
             the camera model with scaled parameters.
         """
         # scale the intrinsic parameters
-        self.intrinsics[..., 0, 0] *= scale_factor
-        self.intrinsics[..., 1, 1] *= scale_factor
-        self.intrinsics[..., 0, 2] *= scale_factor
-        self.intrinsics[..., 1, 2] *= scale_factor
+        _scale_intrinsics_(self.intrinsics, scale_factor)
         # scale the image height/width
         self.height *= scale_factor
         self.width *= scale_factor
@@ -354,19 +402,19 @@ class PinholeCamera:
         device: Device,
         dtype: torch.dtype,
     ) -> "PinholeCamera":
+        def _matrix(entries: List[Union[Tensor, float]]) -> Tensor:
+            # copy all the scalar entries to the device at once and write only the tensor entries separately
+            scalars = [0.0 if isinstance(entry, Tensor) else entry for entry in entries]
+            matrix = torch.tensor(scalars, device=device, dtype=dtype).view(4, 4).repeat(batch_size, 1, 1)
+            for idx, entry in enumerate(entries):
+                if isinstance(entry, Tensor):
+                    matrix[:, idx // 4, idx % 4] = entry
+            return matrix
+
         # create the camera matrix
-        intrinsics = zeros(batch_size, 4, 4, device=device, dtype=dtype)
-        intrinsics[..., 0, 0] += fx
-        intrinsics[..., 1, 1] += fy
-        intrinsics[..., 0, 2] += cx
-        intrinsics[..., 1, 2] += cy
-        intrinsics[..., 2, 2] += 1.0
-        intrinsics[..., 3, 3] += 1.0
+        intrinsics = _matrix([fx, 0.0, cx, 0.0, 0.0, fy, cy, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0])
         # create the pose matrix
-        extrinsics = eye(4, device=device, dtype=dtype).repeat(batch_size, 1, 1)
-        extrinsics[..., 0, -1] += tx
-        extrinsics[..., 1, -1] += ty
-        extrinsics[..., 2, -1] += tz
+        extrinsics = _matrix([1.0, 0.0, 0.0, tx, 0.0, 1.0, 0.0, ty, 0.0, 0.0, 1.0, tz, 0.0, 0.0, 0.0, 1.0])
         # create image hegith and width
         height_tmp = zeros(batch_size, device=device, dtype=dtype)
         height_tmp[..., 0] += height
@@ -398,20 +446,14 @@ class PinholeCamerasList(PinholeCamera):
         r"""Initialise the class attributes given a cameras list."""
         if not isinstance(pinholes, (list, tuple)):
             raise TypeError(f"pinhole must of type list or tuple. Got {type(pinholes)}")
-        height, width = [], []
-        intrinsics, extrinsics = [], []
         for pinhole in pinholes:
             if not isinstance(pinhole, PinholeCamera):
                 raise TypeError(f"Argument pinhole must be from type PinholeCamera. Got {type(pinhole)}")
-            height.append(pinhole.height)
-            width.append(pinhole.width)
-            intrinsics.append(pinhole.intrinsics)
-            extrinsics.append(pinhole.extrinsics)
         # concatenate and set members. We will assume BxNx4x4
-        self.height: Tensor = stack(height, dim=1)
-        self.width: Tensor = stack(width, dim=1)
-        self._intrinsics: Tensor = stack(intrinsics, dim=1)
-        self._extrinsics: Tensor = stack(extrinsics, dim=1)
+        self.height: Tensor = stack([pinhole.height for pinhole in pinholes], dim=1)
+        self.width: Tensor = stack([pinhole.width for pinhole in pinholes], dim=1)
+        self._intrinsics: Tensor = stack([pinhole._intrinsics for pinhole in pinholes], dim=1)
+        self._extrinsics: Tensor = stack([pinhole._extrinsics for pinhole in pinholes], dim=1)
         return self
 
     @property
@@ -463,16 +505,13 @@ def pinhole_matrix(pinholes: Tensor, eps: float = 1e-6) -> Tensor:
     if not (len(pinholes.shape) == 2 and pinholes.shape[1] == 12):
         raise AssertionError(pinholes.shape)
     # unpack pinhole values
-    fx, fy, cx, cy = torch.chunk(pinholes[..., :4], 4, dim=1)  # Nx1
-    # create output container
-    k = eye(4, device=pinholes.device, dtype=pinholes.dtype) + eps
-    k = k.view(1, 4, 4).repeat(pinholes.shape[0], 1, 1)  # Nx4x4
-    # fill output with pinhole values
-    k[..., 0, 0:1] = fx
-    k[..., 0, 2:3] = cx
-    k[..., 1, 1:2] = fy
-    k[..., 1, 2:3] = cy
-    return k
+    fx, fy, cx, cy = pinholes[..., 0], pinholes[..., 1], pinholes[..., 2], pinholes[..., 3]  # N
+    # constant entries of the output
+    z = torch.full_like(fx, eps)
+    o = torch.full_like(fx, 1.0 + eps)
+    # assemble the output in a single op
+    k = stack([fx, z, cx, z, z, fy, cy, z, z, z, o, z, z, z, z, o], dim=-1)
+    return k.view(-1, 4, 4)  # Nx4x4
 
 
 def inverse_pinhole_matrix(pinhole: Tensor, eps: float = 1e-6) -> Tensor:
@@ -507,16 +546,16 @@ def inverse_pinhole_matrix(pinhole: Tensor, eps: float = 1e-6) -> Tensor:
     if not (len(pinhole.shape) == 2 and pinhole.shape[1] == 12):
         raise AssertionError(pinhole.shape)
     # unpack pinhole values
-    fx, fy, cx, cy = torch.chunk(pinhole[..., :4], 4, dim=1)  # Nx1
-    # create output container
-    k = eye(4, device=pinhole.device, dtype=pinhole.dtype)
-    k = k.view(1, 4, 4).repeat(pinhole.shape[0], 1, 1)  # Nx4x4
-    # fill output with inverse values
-    k[..., 0, 0:1] = 1.0 / (fx + eps)
-    k[..., 1, 1:2] = 1.0 / (fy + eps)
-    k[..., 0, 2:3] = -1.0 * cx / (fx + eps)
-    k[..., 1, 2:3] = -1.0 * cy / (fy + eps)
-    return k
+    fx, fy, cx, cy = pinhole[..., 0], pinhole[..., 1], pinhole[..., 2], pinhole[..., 3]  # N
+    # constant entries of the output
+    z = torch.zeros_like(fx)
+    o = torch.ones_like(fx)
+    # inverse values
+    fx_inv = 1.0 / (fx + eps)
+    fy_inv = 1.0 / (fy + eps)
+    # assemble the output in a single op
+    k = stack([fx_inv, z, -cx * fx_inv, z, z, fy_inv, -cy * fy_inv, z, z, z, o, z, z, z, z, o], dim=-1)
+    return k.view(-1, 4, 4)  # Nx4x4
 
 
 def scale_pinhole(pinholes: Tensor, scale: Tensor) -> Tensor:
@@ -622,6 +661,8 @@ def homography_i_H_ref(pinhole_i: Tensor, pinhole_ref: Tensor) -> Tensor:
     i_pose_base = get_optical_pose_base(pinhole_i)
     ref_pose_base = get_optical_pose_base(pinhole_ref)
     i_pose_ref = torch.matmul(i_pose_base, inverse_transformation(ref_pose_base))
+    # NOTE: K_ref has the pinhole structure by construction, so its closed-form inverse is cheaper than
+    # solving the linear system K_ref^T H^T = (K_i T)^T and never goes through a batched factorization.
     return torch.matmul(pinhole_matrix(pinhole_i), torch.matmul(i_pose_ref, inverse_pinhole_matrix(pinhole_ref)))
 
 
@@ -390,6 +390,22 @@ class TestPinholeCamera(BaseTester):
         self.assert_close(pinhole_scale.height, pinhole.height * scale_val, atol=1e-4, rtol=1e-4)
         self.assert_close(pinhole_scale.width, pinhole.width * scale_val, atol=1e-4, rtol=1e-4)
 
+    def test_pinhole_camera_scale_dtype(self, device, dtype):
+        batch_size = 2
+        height, width = 4, 6
+        fx, fy, cx, cy = 1, 2, width / 2, height / 2
+        tx, ty, tz = 1, 2, 3
+
+        intrinsics = self._create_intrinsics(batch_size, fx, fy, cx, cy, device=device, dtype=dtype)
+        extrinsics = self._create_extrinsics(batch_size, tx, ty, tz, device=device, dtype=dtype)
+        height = torch.ones(batch_size, device=device, dtype=dtype) * height
+        width = torch.ones(batch_size, device=device, dtype=dtype) * width
+        scale_factor = torch.ones(batch_size, device=device, dtype=torch.float64) * 2.0
+
+        pinhole = kornia.geometry.camera.PinholeCamera(intrinsics, extrinsics, height, width)
+        assert pinhole.scale(scale_factor).intrinsics.dtype == dtype
+        assert pinhole.scale(2.0).intrinsics.dtype == dtype
+
     def test_pinhole_camera_scale_inplace(self, device, dtype):
         batch_size = 2
         height, width = 4, 6
@@ -422,6 +438,100 @@ class TestPinholeCamera(BaseTester):
         self.assert_close(pinhole_scale.height, pinhole.height * scale_val, atol=1e-4, rtol=1e-4)
         self.assert_close(pinhole_scale.width, pinhole.width * scale_val, atol=1e-4, rtol=1e-4)
 
+    def test_pinhole_camera_intrinsics_inverse(self, device, dtype):
+        batch_size = 2
+        height, width = 4, 6
+        fx, fy, cx, cy = 1, 2, width / 2, height / 2
+        tx, ty, tz = 1, 2, 3
+
+        intrinsics = self._create_intrinsics(batch_size, fx, fy, cx, cy, device=device, dtype=dtype).clone()
+        intrinsics[..., 0, 1] = 0.5  # skew
+        extrinsics = self._create_extrinsics(batch_size, tx, ty, tz, device=device, dtype=dtype)
+        height = torch.ones(batch_size, device=device, dtype=dtype) * height
+        width = torch.ones(batch_size, device=device, dtype=dtype) * width
+
+        pinhole = kornia.geometry.camera.PinholeCamera(intrinsics, extrinsics, height, width)
+        intrinsics_inv = pinhole.intrinsics_inverse()
+
+        assert intrinsics_inv.shape == (batch_size, 4, 4)
+        self.assert_close(intrinsics_inv, torch.inverse(intrinsics), atol=1e-4, rtol=1e-4)
+
+        # a generic matrix without the pinhole structure
+        intrinsics_full = intrinsics.clone()
+        intrinsics_full[..., 1, 0] = 0.3
+        intrinsics_full[..., 2, 0] = 0.2
+        intrinsics_full[..., 0, 3] = 0.4
+        pinhole_full = kornia.geometry.camera.PinholeCamera(intrinsics_full, extrinsics, height, width)
+        self.assert_close(pinhole_full.intrinsics_inverse(), torch.inverse(intrinsics_full), atol=1e-4, rtol=1e-4)
+
+    @pytest.mark.parametrize("target_dtype", (torch.float16, torch.bfloat16, torch.float64))
+    def test_pinhole_camera_to(self, target_dtype, device, dtype):
+        batch_size = 2
+        height, width = 4, 6
+        fx, fy, cx, cy = 1, 2, width / 2, height / 2
+        tx, ty, tz = 1, 2, 3
+
+        intrinsics = self._create_intrinsics(batch_size, fx, fy, cx, cy, device=device, dtype=dtype)
+        extrinsics = self._create_extrinsics(batch_size, tx, ty, tz, device=device, dtype=dtype)
+        height = torch.ones(batch_size, device=device, dtype=dtype) * height
+        width = torch.ones(batch_size, device=device, dtype=dtype) * width
+
+        pinhole = kornia.geometry.camera.PinholeCamera(intrinsics, extrinsics, height, width)
+        pinhole_to = pinhole.clone().to(dtype=target_dtype)
+
+        assert pinhole_to.intrinsics.dtype == target_dtype
+        assert pinhole_to.extrinsics.dtype == target_dtype
+        assert pinhole_to.height.dtype == dtype
+        assert pinhole_to.width.dtype == dtype
+        assert pinhole_to.intrinsics_inverse().dtype == target_dtype
+        assert pinhole_to.scale(2.0).intrinsics.dtype == target_dtype
+        self.assert_close(pinhole_to.intrinsics.to(dtype), pinhole.intrinsics)
+        self.assert_close(pinhole_to.height, pinhole.height)
+        self.assert_close(pinhole_to.width, pinhole.width)
+
+        # image sizes not representable in reduced precision must be preserved
+        height_kitti = torch.full((batch_size,), 375.0, device=device, dtype=torch.float32)
+        width_kitti = torch.full((batch_size,), 1242.0, device=device, dtype=torch.float32)
+        pinhole_kitti = kornia.geometry.camera.PinholeCamera(
+            intrinsics.float(), extrinsics.float(), height_kitti, width_kitti
+        ).to(dtype=torch.bfloat16)
+        self.assert_close(pinhole_kitti.height, height_kitti)
+        self.assert_close(pinhole_kitti.width, width_kitti)
+
+        with pytest.raises(ValueError):
+            pinhole.to(dtype=torch.int64)
+
+    @pytest.mark.parametrize("batch_size", (1, 3))
+    def test_pinhole_camera_from_parameters(self, batch_size, device, dtype):
+        height, width = 4, 6
+        fx, fy, cx, cy = 1, 2, width / 2, height / 2
+        tx, ty, tz = 1, 2, 3
+
+        pinhole = kornia.geometry.camera.PinholeCamera.from_parameters(
+            fx, fy, cx, cy, height, width, tx, ty, tz, batch_size, device=device, dtype=dtype
+        )
+        intrinsics = self._create_intrinsics(batch_size, fx, fy, cx, cy, device=device, dtype=dtype)
+        extrinsics = self._create_extrinsics(batch_size, tx, ty, tz, device=device, dtype=dtype)
+        self.assert_close(pinhole.intrinsics, intrinsics)
+        self.assert_close(pinhole.extrinsics, extrinsics)
+
+        fx_batch = torch.arange(1, batch_size + 1, device=device, dtype=dtype)
+        pinhole = kornia.geometry.camera.PinholeCamera.from_parameters(
+            fx_batch, fy, cx, cy, height, width, tx, ty, tz, batch_size, device=device, dtype=dtype
+        )
+        self.assert_close(pinhole.fx, fx_batch)
+
+    def test_exception(self, device, dtype):
+        intrinsics = self._create_intrinsics(2, 1, 2, 3, 2, device=device, dtype=dtype)
+        extrinsics = self._create_extrinsics(2, 1, 2, 3, device=device, dtype=dtype)
+        height = torch.ones(2, device=device, dtype=dtype)
+        width = torch.ones(3, device=device, dtype=dtype)
+        with pytest.raises(ValueError):
+            kornia.geometry.camera.PinholeCamera(intrinsics, extrinsics, height, width)
+
+        with pytest.raises(ValueError):
+            kornia.geometry.camera.PinholeCamera(intrinsics[..., :3, :3], extrinsics, height, height)
+
     def test_pinhole_camera_project_and_unproject(self, device, dtype):
         batch_size = 5
         n = 2  # Point per batch
@@ -457,3 +567,58 @@ class TestPinholeCamera(BaseTester):
 
         pinhole = kornia.geometry.camera.PinholeCamera(intrinsics, extrinsics, height, width)
         assert pinhole.device() == intrinsics.device
+
+
+class TestPinholeMatrix(BaseTester):
+    @pytest.mark.parametrize("batch_size", (1, 3))
+    def test_smoke(self, batch_size, device, dtype):
+        pinholes = torch.rand(batch_size, 12, device=device, dtype=dtype) + 1.0
+        k = kornia.geometry.camera.pinhole.pinhole_matrix(pinholes)
+        k_inv = kornia.geometry.camera.pinhole.inverse_pinhole_matrix(pinholes)
+        assert k.shape == (batch_size, 4, 4)
+        assert k_inv.shape == (batch_size, 4, 4)
+        assert k.dtype == k_inv.dtype == dtype
+        eye = torch.eye(4, device=device, dtype=dtype).expand(batch_size, -1, -1)
+        self.assert_close(k @ k_inv, eye, atol=1e-4, rtol=1e-4)
+
+    @pytest.mark.parametrize(
+        "op",
+        (kornia.geometry.camera.pinhole.pinhole_matrix, kornia.geometry.camera.pinhole.inverse_pinhole_matrix),
+    )
+    def test_dynamo(self, op, device, dtype, torch_optimizer):
+        pinholes = torch.rand(2, 12, device=device, dtype=dtype) + 1.0
+        op_optimized = torch_optimizer(op)
+        self.assert_close(op(pinholes), op_optimized(pinholes))
+
+
+class TestPinholeCamerasList(BaseTester):
+    def test_smoke(self, device, dtype):
+        batch_size, num_cameras = 2, 3
+        pinholes = []
+        for _ in range(num_cameras):
+            intrinsics = torch.rand(batch_size, 4, 4, device=device, dtype=dtype)
+            extrinsics = torch.rand(batch_size, 4, 4, device=device, dtype=dtype)
+            height = torch.rand(batch_size, device=device, dtype=dtype)
+            width = torch.rand(batch_size, device=device, dtype=dtype)
+            pinholes.append(kornia.geometry.camera.pinhole.PinholeCamera(intrinsics, extrinsics, height, width))
+
+        pinholes_list = kornia.geometry.camera.pinhole.PinholeCamerasList(pinholes)
+
+        assert pinholes_list.num_cameras == num_cameras
+        assert pinholes_list.intrinsics.shape == (batch_size, num_cameras, 4, 4)
+        assert pinholes_list.extrinsics.shape == (batch_size, num_cameras, 4, 4)
+        assert pinholes_list.height.shape == (batch_size, num_cameras)
+        assert pinholes_list.width.shape == (batch_size, num_cameras)
+        for idx, pinhole in enumerate(pinholes):
+            pinhole_idx = pinholes_list.get_pinhole(idx)
+            self.assert_close(pinhole_idx.intrinsics, pinhole.intrinsics)
+            self.assert_close(pinhole_idx.extrinsics, pinhole.extrinsics)
+            self.assert_close(pinhole_idx.height, pinhole.height)
+            self.assert_close(pinhole_idx.width, pinhole.width)
+
+    def test_exception(self, device, dtype):
+        with pytest.raises(TypeError):
+            kornia.geometry.camera.pinhole.PinholeCamerasList(None)
+
+        with pytest.raises(TypeError):
+            kornia.geometry.camera.pinhole.PinholeCamerasList([torch.rand(1, 4, 4, device=device, dtype=dtype)])